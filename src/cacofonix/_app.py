@@ -3,9 +3,11 @@ import secrets
 import time
 from datetime import date
 from fs.base import FS
+from fs.errors import FileExists, ResourceNotFound
 from fs.path import join, dirname, basename, splitext
 from semver import VersionInfo, parse_version_info
 from typing import (
+    BinaryIO,
     Iterable,
     List,
     Optional,
@@ -30,12 +32,13 @@ class Application(object):
     def __init__(self, config: Config, effects: SideEffects):
         self.config = config
         self.effects = effects
+        self._known_versions_cache = None
         fragments_path = effects.fragments_fs.getsyspath('.')
         log.debug(f'Fragments root: {fragments_path}')
 
-    def load_fragment(self, fd: TextIO) -> Fragment:
+    def load_fragment(self, fd: Union[str, BinaryIO, TextIO]) -> Fragment:
         """
-        Parse and validate a fragment from a stream.
+        Parse and validate a fragment from a string or stream.
         """
         fragment = _yaml.load(fd)
         fragment['issues'] = {
@@ -51,17 +54,18 @@ class Application(object):
         """
         log.debug(f'Finding fragments for version {version}')
         fragments_fs = self.effects.fragments_fs
-        name = str(version)
-        if fragments_fs.exists(name):
-            version_fs = fragments_fs.opendir(name)
-            matches = version_fs.filterdir(
-                '.',
-                files=['*.yaml'],
-                exclude_files=[self.METADATA_FILENAME])
-            for file_info in matches:
-                file_path = file_info.name
-                log.debug(f'Found {file_path}')
-                yield version_fs, file_path
+        try:
+            version_fs = fragments_fs.opendir(str(version))
+        except ResourceNotFound:
+            return
+        for file_info in version_fs.scandir('.'):
+            file_path = file_info.name
+            if (file_info.is_dir or
+                    not file_path.endswith('.yaml') or
+                    file_path == self.METADATA_FILENAME):
+                continue
+            log.debug(f'Found {file_path}')
+            yield version_fs, file_path
 
     def find_new_fragments(self) -> Iterable[FoundFragment]:
         """
@@ -79,7 +83,9 @@ class Application(object):
         """
         Archive new fragment, into the path for ``version``.
         """
+        self._known_versions_cache = None
         problems = []
+        archived = []
         n = 0
         with self.effects.archive_fs(str(version)) as archive_fs:
             log.info(f'Archiving for {version}')
@@ -89,7 +95,7 @@ class Application(object):
                     archive_path = archive_fs.getsyspath(filename)
                     log.info(f'Archive {path} -> {archive_path}')
                     self.effects.git_mv(path, archive_path)
-                    self.effects.git_stage(archive_path)
+                    archived.append(archive_path)
                 except (OSError, FileNotFoundError):
                     log.exception(
                         f'Unable to archive fragment: {version_fs} {filename}')
@@ -104,8 +110,10 @@ class Application(object):
                 log.debug(metadata)
                 archive_fs.settext(
                     self.METADATA_FILENAME, _yaml.dump(metadata))
-                metadata_path = archive_fs.getsyspath(self.METADATA_FILENAME)
-                self.effects.git_stage(metadata_path)
+                archived.append(
+                    archive_fs.getsyspath(self.METADATA_FILENAME))
+
+            self.effects.git_stage(*archived)
 
         return n, problems
 
@@ -113,16 +121,19 @@ class Application(object):
         """
         Generate a unique filename for a fragment, and write the content to it.
         """
-        filename = '{}-{}.yaml'.format(
-            int(time.time() * 1000),
-            secrets.token_urlsafe(6))
+        timestamp = time.time_ns() // 1_000_000
+        filename = f'{timestamp}-{secrets.token_urlsafe(6)}.yaml'
         with self.effects.archive_fs('next') as next_fs:
-            if next_fs.exists(filename):
-                raise RuntimeError(
-                    'Generated fragment name already exists!', filename)
             path = next_fs.getsyspath(filename)
             log.debug(f'Writing new fragment {path}')
-            next_fs.settext(filename, yaml_text)
+            try:
+                # Exclusive creation, so an existing fragment is never
+                # clobbered.
+                with next_fs.open(filename, 'x', encoding='utf-8') as fd:
+                    fd.write(yaml_text)
+            except FileExists:
+                raise RuntimeError(
+                    'Generated fragment name already exists!', filename)
             self.effects.git_stage(path)
             return filename
 
@@ -165,26 +176,28 @@ class Application(object):
         Compile fragment files into `parent_dir`.
         """
         outputs = []
+        fragment_types = self.config.fragment_types
+        output_type = self.config.changelog_output_type
         for version_fs, filename in found_fragments:
             try:
-                fragment = self.load_fragment(version_fs.readtext(filename))
+                with version_fs.openbin(filename) as fd:
+                    fragment = self.load_fragment(fd)
                 fragment_type = fragment.get('type')
-                showcontent = self.config.fragment_types.get(
+                showcontent = fragment_types.get(
                     fragment_type, {}).get('showcontent', True)
                 section = fragment.get('section') or None
                 rendered_content = render_fragment(
                     fragment,
                     showcontent,
-                    self.config.changelog_output_type)
+                    output_type)
                 if rendered_content.strip():
                     filename_stem = splitext(basename(filename))[0]
                     output_path = join(*filter(None, [
                         section,
-                        '{}.{}'.format(filename_stem, fragment_type)]))
-                    log.info(
-                        'Compiling {} -> {}'.format(
-                            version_fs.getsyspath(filename),
-                            write_fs.getsyspath(output_path)))
+                        f'{filename_stem}.{fragment_type}']))
+                    src_path = version_fs.getsyspath(filename)
+                    dst_path = write_fs.getsyspath(output_path)
+                    log.info(f'Compiling {src_path} -> {dst_path}')
                     parent_dir = dirname(output_path)
                     if parent_dir:
                         write_fs.makedirs(parent_dir, recreate=True)
@@ -221,7 +234,8 @@ class Application(object):
             changelog_path = changelog_fs.getsyspath(
                 self.config.changelog_path)
             merge_with_existing_changelog(
-                changelog_path,
+                changelog_fs.getsyspath('.'),
+                self.config.changelog_path,
                 self.config.changelog_marker,
                 changelog)
             self.effects.git_stage(changelog_path)
@@ -236,14 +250,16 @@ class Application(object):
         """
         Sorted list of archived versions.
         """
-        fragments_fs = self.effects.fragments_fs
-        return sorted(
-            (parse_version_info(info.name) for info in
-             fragments_fs.filterdir(
-                 '.',
-                 exclude_files=['*'],
-                 exclude_dirs=['next'])),
-            reverse=True)
+        if self._known_versions_cache is None:
+            fragments_fs = self.effects.fragments_fs
+            self._known_versions_cache = sorted(
+                (parse_version_info(info.name) for info in
+                 fragments_fs.filterdir(
+                     '.',
+                     exclude_files=['*'],
+                     exclude_dirs=['next'])),
+                reverse=True)
+        return list(self._known_versions_cache)
 
 
 def package_json(cwd_fs: FS):
@@ -251,13 +267,15 @@ def package_json(cwd_fs: FS):
     Try guess a version from ``package.json``.
     """
     log.debug('Looking for package.json')
-    if cwd_fs.exists('package.json'):
-        log.debug('Guessing version with package.json')
-        try:
-            with cwd_fs.open('package.json', 'r') as fd:
-                return json.load(fd).get('version')
-        except json.JSONDecodeError:
-            pass
+    try:
+        content = cwd_fs.readbytes('package.json')
+    except ResourceNotFound:
+        return None
+    log.debug('Guessing version with package.json')
+    try:
+        return json.loads(content).get('version')
+    except json.JSONDecodeError:
+        pass
     return None
 
 
@@ -1,18 +1,9 @@
 import click
-from aniso8601 import parse_date
-from collections import OrderedDict
 from datetime import date
-from semver import VersionInfo, parse_version_info
-from typing import Iterable, Optional
+from typing import Iterable, Optional, TYPE_CHECKING
 
-from ._app import Application
-from ._prompt import (
-    prompt_choice,
-    prompt_feature_flag,
-    prompt_issue,
-    prompt_many,
-    prompt_markdown,
-    required)
+if TYPE_CHECKING:
+    from semver import VersionInfo
 
 
 def iso8601date(ctx, param, value):
@@ -22,6 +13,7 @@ def iso8601date(ctx, param, value):
     """
     if value is None:
         return date.today()
+    from aniso8601 import parse_date
     return parse_date(value)
 
 
@@ -30,14 +22,13 @@ def split_issues(ctx, param, value):
     Split issue arguments into number and URL components.
     """
     def _split_one(value):
-        parts = [x.strip() for x in value.split(':', 1) if x.strip()]
-        if len(parts) < 1:
+        issue_number, _, issue_url = value.partition(':')
+        issue_number = issue_number.strip()
+        if not issue_number:
             raise click.BadParameter(
                 'Invalid issue format, should be issue_number or '
                 'issue_number:issue_url')
-        elif len(parts) < 2:
-            parts = parts + ['ISSUE_URL_HERE']
-        return tuple(parts)
+        return issue_number, issue_url.strip() or 'ISSUE_URL_HERE'
     return [_split_one(v) for v in value]
 
 
@@ -57,7 +48,7 @@ def validate_section(ctx, param, value):
     Validate that a given section exists.
     """
     config = ctx.obj.config
-    if value and config.has_section(value):
+    if value and not config.has_section(value):
         raise click.BadParameter(
             'Missing or unknown section: {}'.format(value))
     return value
@@ -72,6 +63,13 @@ def compose_interactive(
 
     Provided values will act as defaults for their respective prompts.
     """
+    from ._prompt import (
+        prompt_choice,
+        prompt_feature_flag,
+        prompt_issue,
+        prompt_many,
+        prompt_markdown,
+        required)
     fragment_type = prompt_choice(
         'Change type',
         choices=available_fragment_types,
@@ -80,36 +78,35 @@ def compose_interactive(
         'Section',
         choices=available_sections,
         default=kw.get('section') or '')
-    issues = tuple(prompt_many(
+    issues = prompt_many(
         prompt_issue,
-        kw.get('issues') or []))
-    feature_flags = tuple(prompt_many(
+        kw.get('issues') or [])
+    feature_flags = prompt_many(
         prompt_feature_flag,
-        kw.get('feature_flags', ())))
+        kw.get('feature_flags', ()))
     description = prompt_markdown(
        'Description',
        default=kw.get('description') or '',
-       validator=required).strip()
-    change_data = OrderedDict([
-        ('fragment_type', fragment_type),
-        ('section', section),
-        ('issues', issues),
-        ('feature_flags', feature_flags),
-        ('description', description),
-    ])
-    kw.update(change_data)
+       validator=required()).strip()
+    kw.update(
+        fragment_type=fragment_type,
+        section=section,
+        issues=issues,
+        feature_flags=feature_flags,
+        description=description)
     return kw
 
 
-def guess_version(ctx, param, value) -> Optional[VersionInfo]:
+def guess_version(ctx, param, value) -> Optional['VersionInfo']:
     """
     Try guess a version.
     """
+    from semver import parse_version_info
     if value is not None:
         return None, value
     else:
-        app = ctx.find_object(Application)
-        value = app.guess_version(app.effects.cwd_fs())
+        app = ctx.obj.app
+        value = app.guess_version(app.effects.cwd_fs)
 
     if value is None:
         raise click.BadParameter(
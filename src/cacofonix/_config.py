@@ -1,5 +1,5 @@
 import os
-from collections import OrderedDict
+from operator import attrgetter
 from typing import TextIO, Iterable, Optional, TypeVar, Container
 
 from . import _yaml
@@ -7,16 +7,23 @@ from . import _yaml
 
 T = TypeVar('T')
 
-default_sections = OrderedDict([('', '')])
+default_sections = {'': ''}
 
-default_fragment_types = OrderedDict([
-    (u'feature', {'title': u'Added', 'showcontent': True}),
-    (u'change', {'title': u'Changed', 'showcontent': True}),
-    (u'bugfix', {'title': u'Fixed', 'showcontent': True}),
-    (u'doc', {'title': u'Documentation', 'showcontent': True}),
-    (u'removal', {'title': u'Removed', 'showcontent': True}),
-    (u'misc', {'title': u'Misc', 'showcontent': False}),
-])
+default_fragment_types = {
+    'feature': {'title': 'Added', 'showcontent': True},
+    'change': {'title': 'Changed', 'showcontent': True},
+    'bugfix': {'title': 'Fixed', 'showcontent': True},
+    'doc': {'title': 'Documentation', 'showcontent': True},
+    'removal': {'title': 'Removed', 'showcontent': True},
+    'misc': {'title': 'Misc', 'showcontent': False},
+}
+
+
+# Underline sets used by towncrier, by output type.
+towncrier_underlines = {
+    'markdown': ('##', '###', '####'),
+    'rest': ('=', '-', '~'),
+}
 
 
 def validate_defined(value: Optional[T], hint=None) -> T:
@@ -53,6 +60,7 @@ class Config(object):
         'sections',
         'fragment_types',
     ]
+    _slot_values = attrgetter(*__slots__)
 
     def __init__(self, **kw):
         super(Config, self).__init__()
@@ -60,8 +68,7 @@ class Config(object):
             setattr(self, key, val)
 
     def __repr__(self):
-        obj = {key: getattr(self, key) for key in self.__slots__}
-        return repr(obj)
+        return repr(dict(zip(self.__slots__, self._slot_values(self))))
 
     @classmethod
     def parse(cls, fd: TextIO) -> 'Config':
@@ -75,11 +82,11 @@ class Config(object):
         config['changelog_marker'] = config.setdefault(
             'changelog_marker',
             '<!-- Generated release notes start. -->')
-        config['fragment_types'] = OrderedDict([
-            (key, make_fragment_type(**fragment_type)) for
+        config['fragment_types'] = {
+            key: make_fragment_type(**fragment_type) for
             key, fragment_type in
             config.get('fragment_types', default_fragment_types).items()
-        ])
+        }
         config['changelog_output_type'] = validate_oneof(
             config.get('changelog_output_type', 'markdown'),
             {'markdown', 'rest'})
@@ -88,9 +95,9 @@ class Config(object):
         validate_defined(config.get('change_fragments_path'),
                          'change_fragments_path')
 
-        sections = default_sections.copy()
-        sections.update(config.get('sections', {}))
-        config['sections'] = sections
+        config['sections'] = {
+            **default_sections,
+            **(config.get('sections') or {})}
         return Config(**config)
 
     def available_sections(self) -> Iterable[str]:
@@ -122,10 +129,7 @@ class Config(object):
         """
         Pick a suitable underline set for towncrier, based on the output type.
         """
-        return {
-            'markdown': ['##', '###', '####'],
-            'rest': ['=', '-', '~'],
-        }[self.changelog_output_type]
+        return towncrier_underlines[self.changelog_output_type]
 
     def _towncrier_fragment_types(self):
         """
@@ -142,6 +146,19 @@ class Config(object):
         """
         Generate a `sections` structure for towncrier.
         """
+        try:
+            with os.scandir(parent_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            return {}
+        present.add('')
+
+        def _exists(path):
+            if '/' in path:
+                # Nested sections are not in the listing of `parent_dir`.
+                return os.path.exists(os.path.join(parent_dir, path))
+            return path in present
+
         return {title: path for path, title in
                 self.sections.items()
-                if os.path.exists(os.path.join(parent_dir, path))}
+                if _exists(path)}
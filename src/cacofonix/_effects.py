@@ -2,13 +2,17 @@ from abc import ABC, abstractmethod
 from fs import open_fs
 from fs.base import FS
 from fs.wrap import read_only
-from subprocess import check_call, check_output
-from typing import Optional
+from functools import cached_property, lru_cache
+from subprocess import CalledProcessError, check_call, check_output
+from typing import List, Optional
 
 from . import _log as log
 from ._config import Config
 
 
+GIT_ARGS_BATCH_SIZE = 1000
+
+
 class SideEffects(ABC):
     """
     Abstract side effects class.
@@ -33,6 +37,7 @@ class SideEffects(ABC):
         # TODO: This is not ideal, since it allows access to the rest of the
         # directory too.
 
+    @cached_property
     def cwd_fs(self) -> FS:
         """
         Read-only version of the current working directory.
@@ -43,18 +48,7 @@ class SideEffects(ABC):
         """
         ``git config user.name`` and ``git config user.email``.
         """
-        username = check_output(
-            ['git', 'config', 'user.name'], text=True).strip()
-        email = check_output(
-            ['git', 'config', 'user.email'], text=True).strip()
-        if not username and not email:
-            return None
-
-        if not email:
-            return username
-        elif not username:
-            return f'<{email}>'
-        return f'{username} <{email}>'
+        return _git_user()
 
     @abstractmethod
     def git_mv(self, src: str, dst: str) -> None:
@@ -63,9 +57,14 @@ class SideEffects(ABC):
         """
 
     @abstractmethod
-    def git_stage(self, src: str) -> None:
+    def git_stage(self, *srcs: str) -> None:
+        """
+        ``git stage <src>...``
+        """
+
+    def flush(self) -> None:
         """
-        ``git stage <src>``
+        Perform any side effects that were deferred.
         """
 
 
@@ -79,6 +78,9 @@ class RealSideEffects(SideEffects):
         self.fragments_fs = root_fs.makedir(
             config.change_fragments_path,
             recreate=True)
+        # Staging is deferred until `flush`, so that everything can be staged
+        # with as few git processes as possible.
+        self._pending_stage: List[str] = []
 
     def archive_fs(self, path: str) -> FS:
         return self.fragments_fs.makedir(path, recreate=True)
@@ -89,8 +91,47 @@ class RealSideEffects(SideEffects):
     def git_mv(self, src, dst):
         check_call(['git', 'mv', src, dst])
 
-    def git_stage(self, src):
-        check_call(['git', 'add', src])
+    def git_stage(self, *srcs):
+        self._pending_stage.extend(srcs)
+
+    def flush(self):
+        srcs, self._pending_stage = self._pending_stage, []
+        # Stay well clear of the platform's argument length limit.
+        for i in range(0, len(srcs), GIT_ARGS_BATCH_SIZE):
+            check_call(
+                ['git', 'add', '--'] + srcs[i:i + GIT_ARGS_BATCH_SIZE])
+
+
+@lru_cache(maxsize=None)
+def _git_user() -> Optional[str]:
+    """
+    Look up the git user, the configuration is not expected to change while
+    we are running.
+    """
+    try:
+        output = check_output(
+            ['git', 'config', '--get-regexp', r'^user\.(name|email)$'],
+            text=True)
+    except CalledProcessError as e:
+        # Exit status 1 means nothing matched, anything else is a real error.
+        if e.returncode != 1:
+            raise
+        output = ''
+    # Later values take precedence, just like ``git config <name>``.
+    user = {}
+    for line in output.splitlines():
+        key, _, value = line.partition(' ')
+        user[key] = value.strip()
+    username = user.get('user.name', '')
+    email = user.get('user.email', '')
+    if not username and not email:
+        return None
+
+    if not email:
+        return username
+    elif not username:
+        return f'<{email}>'
+    return f'{username} <{email}>'
 
 
 def _dry_run_method(name: str):
@@ -98,11 +139,9 @@ def _dry_run_method(name: str):
     Create a dry run stub that logs the action it would have taken.
     """
     def _func(self, *a, **kw):
-        log.info(
-            'Dry run of {}: {} {}'.format(
-                name,
-                ' '.join(map(repr, a)),
-                ' '.join(f'{key}={repr(value)}' for key, value in kw.items())))
+        # Formatting is left to logging, so it only happens for messages that
+        # are actually emitted.
+        log.info('Dry run of %s: args=%r kwargs=%r', name, a, kw)
     return _func
 
 
@@ -1,26 +1,20 @@
 import logging
 
 
-_logger = None
+# Until logging is set up, log via the root logger.
+debug = logging.debug
+warning = logging.warning
+info = logging.info
+error = logging.error
+exception = logging.exception
 
 
 def setup_logging(level):
     logging.basicConfig(level=level)
-    global _logger
-    _logger = logging.getLogger('cacofonix')
-
-
-def _log_method(name):
-    def __log_method(*a, **kw):
-        global _logger
-        if _logger is None:
-            _logger = logging
-        return getattr(_logger, name)(*a, **kw)
-    return __log_method
-
-
-debug = _log_method('debug')
-warning = _log_method('warning')
-info = _log_method('info')
-error = _log_method('error')
-exception = _log_method('exception')
+    global debug, warning, info, error, exception
+    logger = logging.getLogger('cacofonix')
+    debug = logger.debug
+    warning = logger.warning
+    info = logger.info
+    error = logger.error
+    exception = logger.exception
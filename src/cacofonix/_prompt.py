@@ -1,28 +1,48 @@
-from prompt_toolkit import (
-    print_formatted_text,
-    prompt as _prompt)
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit.formatted_text import PygmentsTokens
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.lexers import PygmentsLexer
-from prompt_toolkit.styles import Style
-from prompt_toolkit.styles import style_from_pygments_cls, merge_styles
-from prompt_toolkit.validation import Validator
-from pygments import lex
-from pygments.styles import get_style_by_name
-from pygments.lexers.data import YamlLexer
-from pygments.lexers.markup import MarkdownLexer
+from functools import lru_cache
 from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
 
 
-default_style = style_from_pygments_cls(get_style_by_name('monokai'))
-prompt_style = merge_styles([
-    default_style,
-    Style.from_dict({
-        'prompt': 'cyan',
-        'hint': 'grey',
-    })
-])
+# prompt_toolkit and Pygments are only imported once something is prompted
+# for, most commands never need them.
+
+
+@lru_cache(maxsize=None)
+def _prompt_style():
+    """
+    Style used for prompts and formatted output.
+    """
+    from prompt_toolkit.styles import (
+        Style,
+        merge_styles,
+        style_from_pygments_cls)
+    from pygments.styles import get_style_by_name
+    default_style = style_from_pygments_cls(get_style_by_name('monokai'))
+    return merge_styles([
+        default_style,
+        Style.from_dict({
+            'prompt': 'cyan',
+            'hint': 'grey',
+        })
+    ])
+
+
+@lru_cache(maxsize=None)
+def _yaml_lexer():
+    """
+    Pygments lexer for highlighting YAML output.
+    """
+    from pygments.lexers.data import YamlLexer
+    return YamlLexer()
+
+
+@lru_cache(maxsize=None)
+def _markdown_lexer():
+    """
+    prompt_toolkit lexer for highlighting Markdown input.
+    """
+    from prompt_toolkit.lexers import PygmentsLexer
+    from pygments.lexers.markup import MarkdownLexer
+    return PygmentsLexer(MarkdownLexer)
 
 
 PromptTextList = List[Tuple[str, str]]
@@ -40,6 +60,7 @@ def prompt(
     """
     Wrapper around ``prompt_toolkit.prompt``.
     """
+    from prompt_toolkit import prompt as _prompt
     if isinstance(message, str):
         message = [('class:prompt', f'{message}')]
     if hint is not None:
@@ -49,7 +70,7 @@ def prompt(
         message = message + [('class:prompt', '\n')]
     return _prompt(
         message, *a,
-        style=prompt_style,
+        style=_prompt_style(),
         multiline=multiline,
         include_default_pygments_style=False,
         **kw)
@@ -60,6 +81,7 @@ def validator(error_message: str):
     Decorate a predicate function as a ``prompt_toolkit`` validator.
     """
     def _validation(f):
+        from prompt_toolkit.validation import Validator
         return Validator.from_callable(
             f,
             error_message=error_message,
@@ -73,34 +95,48 @@ def is_one_of(words: List[str]):
     """
     error_message = 'Value must be one of: {}'.format(
         ', '.join(words))
-    return validator(error_message)(lambda word: word in words)
+    # Validation happens on every keystroke.
+    word_set = frozenset(words)
+    return validator(error_message)(lambda word: word in word_set)
 
 
-@validator('Value is required')
-def required(value: Any):
+@lru_cache(maxsize=None)
+def required():
     """
     Value is required.
     """
-    return bool(value)
+    return validator('Value is required')(bool)
+
+
+@lru_cache(maxsize=32)
+def _choice_helpers(choices: Tuple[str, ...]):
+    """
+    Completer, validator and hint text for a set of choices.
+    """
+    from prompt_toolkit.completion import WordCompleter
+    return (
+        WordCompleter(list(choices)),
+        is_one_of(list(choices)),
+        ', '.join(choices))
 
 
 def prompt_choice(prompt_text: str, choices: Iterable[str], default: str = ''):
     """
     Prompt for a single choices from a set of options.
     """
-    completer = WordCompleter(choices)
-    choices_text = ', '.join(choices)
+    completer, choice_validator, choices_text = _choice_helpers(
+        tuple(choices))
     return prompt(
         prompt_text,
         hint=choices_text,
         default=default,
         completer=completer,
-        validator=is_one_of(choices))
+        validator=choice_validator)
 
 
 def prompt_many(
         prompt_func: PromptFunc,
-        initial: PromptManyResults = []) -> PromptManyResults:
+        initial: PromptManyResults = []) -> List[Any]:
     """
     Prompt for many of the same thing.
 
@@ -137,7 +173,7 @@ def prompt_issue(results: PromptManyResults = []) -> Optional[Tuple[str, str]]:
         issue_url = prompt(
             'Issue URL',
             hint=f'for issue {issue}',
-            validator=required).strip()
+            validator=required()).strip()
         return (issue, issue_url)
     return None
 
@@ -146,6 +182,7 @@ def prompt_markdown(message: PromptMessage, **kw) -> str:
     """
     Prompt for a multiline Markdown input.
     """
+    from prompt_toolkit.key_binding import KeyBindings
     kb = KeyBindings()
 
     @kb.add('c-d')
@@ -156,7 +193,7 @@ def prompt_markdown(message: PromptMessage, **kw) -> str:
         hint='Ctrl-D to finish',
         multiline=True,
         key_bindings=kb,
-        lexer=PygmentsLexer(MarkdownLexer),
+        lexer=_markdown_lexer(),
         **kw)
 
 
@@ -164,6 +201,7 @@ def prompt_confirm(message: PromptMessage, default=False, **kw) -> bool:
     """
     Prompt for a yes/no response.
     """
+    from prompt_toolkit.key_binding import KeyBindings
     kb = KeyBindings()
 
     @kb.add('y', eager=True)
@@ -191,5 +229,8 @@ def prompt_confirm(message: PromptMessage, default=False, **kw) -> bool:
 def print_formatted_yaml_text(yaml_text: str) -> None:
     """
     """
-    tokens = list(lex(yaml_text, lexer=YamlLexer()))
-    print_formatted_text(PygmentsTokens(tokens), style=prompt_style)
+    from prompt_toolkit import print_formatted_text
+    from prompt_toolkit.formatted_text import PygmentsTokens
+    from pygments import lex
+    tokens = list(lex(yaml_text, lexer=_yaml_lexer()))
+    print_formatted_text(PygmentsTokens(tokens), style=_prompt_style())
@@ -1,10 +1,5 @@
-import os
 import pkgutil
-from towncrier._builder import (
-    find_fragments,
-    split_fragments,
-    render_fragments)
-from towncrier._writer import append_to_newsfile
+from functools import lru_cache
 from typing import Iterable, List
 
 from ._util import pluralize
@@ -12,19 +7,17 @@ from ._types import Fragment, OutputType
 from .errors import InvalidChangeMetadata
 
 
-class MarkdownRenderer(object):
-    def link(self, text, url):
-        return f'[{text}]({url})'
+def _markdown_link(text, url):
+    return f'[{text}]({url})'
 
 
-class RestructuredTextRenderer(object):
-    def link(self, text, url):
-        return f'`{text} <{url}>`'
+def _rest_link(text, url):
+    return f'`{text} <{url}>`'
 
 
-_renderers = {
-    'markdown': MarkdownRenderer(),
-    'rest': RestructuredTextRenderer(),
+_links = {
+    'markdown': _markdown_link,
+    'rest': _rest_link,
 }
 
 
@@ -32,9 +25,7 @@ def _ticket_prefix(ticket):
     """
     Add an appropriate prefix to a ticket number.
     """
-    if ticket.isdigit():
-        return f'#{ticket}'
-    return ticket
+    return '#' + ticket if ticket.isdigit() else ticket
 
 
 def render_fragment(
@@ -44,44 +35,48 @@ def render_fragment(
     """
     Compile a fragment into towncrier-compatible content.
     """
-    renderer = _renderers[output_type]
+    link = _links[output_type]
     feature_flag_text = ''
     feature_flags = fragment.get('feature_flags')
     if feature_flags:
-        feature_flag_text = ' ({feature}: {flags})'.format(
-            feature=pluralize(len(feature_flags),
-                              'feature',
-                              'features').title(),
-            flags=', '.join(u'`{}`'.format(flag) for flag in feature_flags))
+        feature = pluralize(len(feature_flags), 'feature', 'features').title()
+        flags = [f'`{flag}`' for flag in feature_flags]
+        feature_flag_text = f' ({feature}: {", ".join(flags)})'
 
     issues_text = ''
     issues = fragment.get('issues')
     if issues:
-        issues_text = ' {}'.format(
-           u' '.join(
-               renderer.link(_ticket_prefix(ticket), url)
-               for ticket, url in sorted(issues.items())))
+        links = [
+            link(_ticket_prefix(ticket), url)
+            for ticket, url in sorted(issues.items())]
+        issues_text = ' ' + ' '.join(links)
 
     description_first_text = ''
     description_rest_text = ''
     description = fragment.get('description')
     if description:
-        desc_lines = description.split('\n')
-        description_first_text = desc_lines[0]
-        description_rest_text = '{}{}'.format(
-            '\n' if len(desc_lines) > 1 else u'',
-            '\n'.join(desc_lines[1:])).rstrip()
+        description_first_text, sep, rest = description.partition('\n')
+        if sep:
+            description_rest_text = (sep + rest).rstrip()
     else:
         raise InvalidChangeMetadata('Missing change description')
 
     if not showcontent:
         return issues_text
-    return ''.join([
-        description_first_text,
-        feature_flag_text,
-        issues_text,
-        description_rest_text,
-    ])
+    return (
+        f'{description_first_text}{feature_flag_text}{issues_text}'
+        f'{description_rest_text}')
+
+
+@lru_cache(maxsize=4)
+def _load_template(output_type: OutputType) -> str:
+    """
+    Load the towncrier template for an output type.
+    """
+    template_name = (
+        'templates/towncrier_markdown.tmpl' if output_type == 'markdown' else
+        'templates/towncrier_rest.tmpl')
+    return pkgutil.get_data(__name__, template_name).decode('utf-8')
 
 
 def render_changelog(
@@ -98,16 +93,17 @@ def render_changelog(
     This changelog can be merged into an existing changelog with
     `merge_with_existing_changelog`.
     """
+    from towncrier._builder import (
+        find_fragments,
+        split_fragments,
+        render_fragments)
     fragments, fragment_filenames = find_fragments(
         fragment_path,
         sections,
         None,
         fragment_types)
     fragments = split_fragments(fragments, fragment_types)
-    template_name = (
-        'templates/towncrier_markdown.tmpl' if output_type == 'markdown' else
-        'templates/towncrier_rest.tmpl')
-    template = pkgutil.get_data(__name__, template_name).decode('utf-8')
+    template = _load_template(output_type)
     issue_format = ''
     wrap = False
     return render_fragments(
@@ -124,6 +120,7 @@ def render_changelog(
 
 
 def merge_with_existing_changelog(
+        base_dir: str,
         changelog_path: str,
         changelog_marker: str,
         content: str):
@@ -131,11 +128,12 @@ def merge_with_existing_changelog(
     Merge new changelog content with an existing changelog.
 
     The new content will be placed below `changelog_marker` in the existing
-    changelog.
+    changelog, `changelog_path` is relative to `base_dir`.
     """
+    from towncrier._writer import append_to_newsfile
     top_line = content.split('\n', 1)[0]
     append_to_newsfile(
-        os.getcwd(),
+        base_dir,
         changelog_path,
         changelog_marker,
         top_line + '\n',
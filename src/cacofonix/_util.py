@@ -1,6 +1,3 @@
-from codecs import encode, decode
-
-
 def pluralize(n: int, singular: str, plural: str) -> str:
     """
     Use the plural or singular form based on some count.
@@ -12,4 +9,7 @@ def string_escape(s: str) -> str:
     """
     Like `.decode('string-escape')` in Python 2 but harder because Python 3.
     """
-    return decode(encode(s, 'latin-1', 'backslashreplace'), 'unicode-escape')
+    if '\\' not in s:
+        # Nothing to unescape.
+        return s
+    return s.encode('latin-1', 'backslashreplace').decode('unicode-escape')
@@ -1,6 +1,11 @@
 import yaml
 from yaml.representer import SafeRepresenter
-from collections import OrderedDict
+
+try:
+    from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+except ImportError:  # pragma: no cover
+    # PyYAML was built without libyaml, use the pure Python implementation.
+    from yaml import SafeLoader as Loader, SafeDumper as Dumper
 
 
 class literal_str(str):
@@ -18,27 +23,36 @@ def change_style(style, representer):
     return new_representer
 
 
-represent_literal_str = change_style('|', SafeRepresenter.represent_str)
-yaml.add_representer(literal_str, represent_literal_str)
+def represent_plain_str(dumper, data):
+    """
+    Represent a `str` subclass as a plain string, libyaml's emitter will not
+    accept anything else.
+    """
+    return SafeRepresenter.represent_str(dumper, str(data))
+
 
-# Parse YAML mappings as OrderedDict, because we care about that sometimes.
-yaml.add_representer(
-    OrderedDict,
-    lambda dumper, data: dumper.represent_dict(data.items()))
-yaml.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-    lambda loader, node: OrderedDict(loader.construct_pairs(node)))
+represent_literal_str = change_style('|', represent_plain_str)
+yaml.add_representer(literal_str, represent_literal_str, Dumper=Dumper)
+# Tuples, such as click's multiple options, are just sequences.
+yaml.add_representer(tuple, SafeRepresenter.represent_list, Dumper=Dumper)
 
 
 def load(fd):
     """
     Load a YAML file.
     """
-    return yaml.load(fd, Loader=yaml.FullLoader)
+    return yaml.load(fd, Loader=Loader)
 
 
 def dump(data):
     """
     Dump a YAML file.
     """
-    return yaml.dump(data)
+    # Mappings are dumped in insertion order, because we care about that
+    # sometimes.
+    return yaml.dump(
+        data,
+        Dumper=Dumper,
+        sort_keys=False,
+        default_flow_style=False,
+        allow_unicode=True)
@@ -1,11 +1,9 @@
 import click
 import datetime
-from fs import open_fs
-from collections import OrderedDict
-from typing import Optional, List, Tuple, TextIO
+from functools import cached_property, update_wrapper
+from typing import Optional, List, Sequence, Tuple, TextIO, TYPE_CHECKING
 
 from . import _yaml
-from ._app import Application
 from ._cli import (
     iso8601date,
     validate_fragment_type,
@@ -20,11 +18,50 @@ from ._config import Config
 from ._util import (
     pluralize,
     string_escape)
-from ._effects import make_effects
 from ._log import setup_logging
 
+if TYPE_CHECKING:
+    from ._app import Application
 
-pass_app = click.make_pass_decorator(Application)
+
+class CliState(object):
+    """
+    State shared by all commands.
+
+    The application, and the filesystem, git and towncrier machinery it pulls
+    in, is only created once a command needs it.
+    """
+    def __init__(self, config: Config, dry_run: bool):
+        self.config = config
+        self.dry_run = dry_run
+
+    @cached_property
+    def app(self) -> 'Application':
+        from fs import open_fs
+        from ._app import Application
+        from ._effects import make_effects
+        effects = make_effects(open_fs('.'), self.config, self.dry_run)
+        return Application(config=self.config, effects=effects)
+
+    def close(self) -> None:
+        """
+        Perform any deferred side effects, if the application was used.
+        """
+        if 'app' in self.__dict__:
+            self.app.effects.flush()
+
+
+pass_state = click.make_pass_decorator(CliState)
+
+
+def pass_app(f):
+    """
+    Like `pass_state` but passes the `Application`.
+    """
+    @click.pass_context
+    def new_func(ctx, *a, **kw):
+        return ctx.invoke(f, ctx.find_object(CliState).app, *a, **kw)
+    return update_wrapper(new_func, f)
 
 
 @click.group()
@@ -51,40 +88,37 @@ def cli(ctx, config: TextIO, dry_run: bool, log_level: str):
     New changes will be integrated into an existing changelog.
     """
     setup_logging(log_level)
-    root_fs = open_fs('.')
-    config = Config.parse(config)
-    ctx.obj = Application(
-        config=config,
-        effects=make_effects(root_fs, config, dry_run))
+    ctx.obj = state = CliState(config=Config.parse(config), dry_run=dry_run)
+    ctx.call_on_close(state.close)
     if dry_run:
         echo_warning('Performing a dry run, no changes will be made!')
 
 
 @cli.command()
-@pass_app
-def list_types(app: Application):
+@pass_state
+def list_types(state: CliState):
     """
     List known fragment types.
     """
-    for fragment_type in app.config.available_fragment_types():
+    for fragment_type in state.config.available_fragment_types():
         if fragment_type:
             echo_out(fragment_type)
 
 
 @cli.command()
-@pass_app
-def list_sections(app: Application):
+@pass_state
+def list_sections(state: CliState):
     """
     List known sections.
     """
-    for section in app.config.available_sections():
+    for section in state.config.available_sections():
         if section:
             echo_out(section)
 
 
 @cli.command()
 @pass_app
-def list_versions(app: Application):
+def list_versions(app: 'Application'):
     """
     List all versions tracked by this tool.
     """
@@ -118,7 +152,7 @@ def list_versions(app: Application):
               is_flag=True,
               help='Complete the changelog fragment interactively')
 @pass_app
-def compose(app: Application, interactive: bool, **kw):
+def compose(app: 'Application', interactive: bool, **kw):
     """
     Compose a new change fragment.
 
@@ -137,17 +171,17 @@ def compose(app: Application, interactive: bool, **kw):
     def _compose(fragment_type: str,
                  section: Optional[str],
                  issues: List[Tuple[str, str]],
-                 feature_flags: List[str],
+                 feature_flags: Sequence[str],
                  description: str,
                  edit: bool):
-        change_fragment_data = OrderedDict([
-            ('type', fragment_type),
-            ('section', section),
-            ('issues', dict(issues)),
-            ('feature_flags', list(feature_flags)),
-            ('description', _yaml.literal_str(
-                string_escape(description or ''))),
-        ])
+        change_fragment_data = {
+            'type': fragment_type,
+            'section': section,
+            'issues': dict(issues),
+            'feature_flags': feature_flags,
+            'description': _yaml.literal_str(
+                string_escape(description or '')),
+        }
         yaml_text = _yaml.dump(change_fragment_data)
 
         echo_info('\nOkay, this is your change:\n')
@@ -211,7 +245,7 @@ def compose(app: Application, interactive: bool, **kw):
               default=True,
               help='Confirm before writing the changelog')
 @pass_app
-def compile(app: Application,
+def compile(app: 'Application',
             draft: bool,
             project_version: Tuple[Optional[str], str],
             version_date: datetime.date,
@@ -228,6 +262,7 @@ def compile(app: Application,
         echo('Guessed version {} via {}'.format(
             version_number, version_guess))
 
+    from fs import open_fs
     new_fragments = list(app.find_new_fragments())
 
     with open_fs('temp://') as tmp_fs:
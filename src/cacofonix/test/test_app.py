@@ -1,4 +1,5 @@
 import os.path
+import pytest
 from fs import open_fs
 from fs.base import FS
 from fs.wrap import read_only
@@ -6,6 +7,7 @@ from fs.wrap import read_only
 from cacofonix._app import Application
 from cacofonix._config import Config
 from cacofonix._effects import SideEffects
+from cacofonix.errors import FragmentCompilationError
 
 
 class MockSideEffects(SideEffects):
@@ -22,7 +24,7 @@ class MockSideEffects(SideEffects):
     def git_mv(self, path: str) -> FS:
         raise NotImplementedError()
 
-    def git_stage(self, path: str) -> FS:
+    def git_stage(self, *paths: str) -> FS:
         raise NotImplementedError()
 
 
@@ -63,3 +65,70 @@ class TestCompileFragmentFiles:
                     found_fragments)
                 assert len(outputs) == 1
                 assert '#1234' in write_fs.readtext(outputs[0])
+
+    def test_preserves_order(self):
+        """
+        Outputs are in the same order as the found fragments.
+        """
+        with open_test_root_fs() as root_fs:
+            config = load_test_config(root_fs)
+            effects = MockSideEffects(root_fs, config)
+            app = Application(config, effects)
+            with open_fs('temp://') as fragments_fs:
+                names = [f'{n}.yaml' for n in range(20)]
+                for name in names:
+                    fragments_fs.writetext(
+                        name,
+                        f'type: bugfix\ndescription: {name}\n')
+                found_fragments = [(fragments_fs, name) for name in names]
+                with open_fs('temp://') as write_fs:
+                    outputs = app.compile_fragment_files(
+                        write_fs,
+                        found_fragments)
+                    assert outputs == [
+                        f'{n}.bugfix' for n in range(20)]
+
+    def test_invalid_fragment(self):
+        """
+        Failing to compile a fragment raises `FragmentCompilationError`.
+        """
+        with open_test_root_fs() as root_fs:
+            config = load_test_config(root_fs)
+            effects = MockSideEffects(root_fs, config)
+            app = Application(config, effects)
+            with open_fs('temp://') as fragments_fs:
+                fragments_fs.writetext('invalid.yaml', 'type: nope\n')
+                found_fragments = [
+                    (effects.fragments_fs, 'numeric_issue_number.yaml'),
+                    (fragments_fs, 'invalid.yaml'),
+                ]
+                with open_fs('temp://') as write_fs:
+                    with pytest.raises(FragmentCompilationError) as e:
+                        app.compile_fragment_files(write_fs, found_fragments)
+                    assert e.value.path == 'invalid.yaml'
+
+
+class TestGuessVersion:
+    """
+    Tests for `Application.guess_version`.
+    """
+    def test_package_json(self):
+        """
+        The version is guessed from ``package.json``, on any filesystem.
+        """
+        with open_test_root_fs() as root_fs:
+            config = load_test_config(root_fs)
+            app = Application(config, MockSideEffects(root_fs, config))
+            with open_fs('mem://') as cwd_fs:
+                cwd_fs.writetext('package.json', '{"version": "1.0"}')
+                assert app.guess_version(cwd_fs) == ('package.json', '1.0')
+
+    def test_no_guess(self):
+        """
+        Nothing is guessed if there is nothing to guess from.
+        """
+        with open_test_root_fs() as root_fs:
+            config = load_test_config(root_fs)
+            app = Application(config, MockSideEffects(root_fs, config))
+            with open_fs('mem://') as cwd_fs:
+                assert app.guess_version(cwd_fs) is None
@@ -0,0 +1,73 @@
+import click
+import pytest
+from types import SimpleNamespace
+
+from cacofonix._cli import (
+    split_issues,
+    validate_fragment_type,
+    validate_section)
+from cacofonix._config import Config
+
+
+class TestSplitIssues:
+    """
+    Tests for `split_issues`.
+    """
+    def test_number_and_url(self):
+        """
+        Issue numbers and URLs are split on the first colon.
+        """
+        assert split_issues(None, None, ['1234:https://example.com/1']) == [
+            ('1234', 'https://example.com/1')]
+
+    def test_number_only(self):
+        """
+        A placeholder URL is used when only an issue number is given.
+        """
+        assert split_issues(None, None, [' 1234 ', '42:']) == [
+            ('1234', 'ISSUE_URL_HERE'),
+            ('42', 'ISSUE_URL_HERE')]
+
+    @pytest.mark.parametrize('value', ['', '  ', ':https://example.com/'])
+    def test_missing_number(self, value):
+        """
+        An issue number is required.
+        """
+        with pytest.raises(click.BadParameter):
+            split_issues(None, None, [value])
+
+
+def make_ctx():
+    """
+    Fake a click context carrying an application with a known config.
+    """
+    config = Config(
+        sections={'': '', 'sdk': 'Software Development Kit'},
+        fragment_types={'bugfix': {'name': 'Fixed', 'showcontent': True}})
+    return SimpleNamespace(obj=SimpleNamespace(config=config))
+
+
+class TestValidateSection:
+    """
+    Tests for `validate_section`.
+    """
+    @pytest.mark.parametrize('value', [None, '', 'sdk'])
+    def test_known(self, value):
+        assert validate_section(make_ctx(), None, value) == value
+
+    def test_unknown(self):
+        with pytest.raises(click.BadParameter):
+            validate_section(make_ctx(), None, 'nope')
+
+
+class TestValidateFragmentType:
+    """
+    Tests for `validate_fragment_type`.
+    """
+    @pytest.mark.parametrize('value', [None, 'bugfix'])
+    def test_known(self, value):
+        assert validate_fragment_type(make_ctx(), None, value) == value
+
+    def test_unknown(self):
+        with pytest.raises(click.BadParameter):
+            validate_fragment_type(make_ctx(), None, 'nope')
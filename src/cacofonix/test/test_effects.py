@@ -0,0 +1,113 @@
+import pytest
+from fs import open_fs
+from subprocess import CalledProcessError
+
+from cacofonix import _effects
+from cacofonix._config import Config
+
+
+@pytest.fixture
+def git_config(monkeypatch):
+    """
+    Fake the output of ``git config``.
+    """
+    def _git_config(output, returncode=1):
+        def check_output(args, **kw):
+            if output is None:
+                raise CalledProcessError(returncode, args)
+            return output
+        monkeypatch.setattr(_effects, 'check_output', check_output)
+        _effects._git_user.cache_clear()
+    yield _git_config
+    _effects._git_user.cache_clear()
+
+
+@pytest.fixture
+def git_calls(monkeypatch):
+    """
+    Record git invocations instead of running them.
+    """
+    calls = []
+    monkeypatch.setattr(_effects, 'check_call', calls.append)
+    return calls
+
+
+@pytest.fixture
+def real_effects():
+    """
+    `RealSideEffects` on an in-memory filesystem.
+    """
+    with open_fs('mem://') as root_fs:
+        config = Config(change_fragments_path='fragments')
+        yield _effects.RealSideEffects(root_fs, config)
+
+
+class TestGitUser:
+    """
+    Tests for `_git_user`.
+    """
+    def test_name_and_email(self, git_config):
+        git_config('user.name Jane Doe\nuser.email jane@example.com\n')
+        assert _effects._git_user() == 'Jane Doe <jane@example.com>'
+
+    def test_name_only(self, git_config):
+        git_config('user.name Jane Doe\n')
+        assert _effects._git_user() == 'Jane Doe'
+
+    def test_email_only(self, git_config):
+        git_config('user.email jane@example.com\n')
+        assert _effects._git_user() == '<jane@example.com>'
+
+    def test_last_value_wins(self, git_config):
+        git_config('user.name Global\nuser.name Local\n')
+        assert _effects._git_user() == 'Local'
+
+    def test_unset(self, git_config):
+        git_config(None)
+        assert _effects._git_user() is None
+
+    def test_git_failure(self, git_config):
+        """
+        Failures other than nothing matching are not mistaken for an unset
+        user.
+        """
+        git_config(None, returncode=128)
+        with pytest.raises(CalledProcessError):
+            _effects._git_user()
+
+
+class TestRealSideEffectsStaging:
+    """
+    Tests for staging with `RealSideEffects`.
+    """
+    def test_stage_is_deferred(self, git_calls, real_effects):
+        """
+        Staging does not run git until the effects are flushed.
+        """
+        real_effects.git_stage('a', 'b')
+        real_effects.git_stage('c')
+        assert git_calls == []
+        real_effects.flush()
+        assert git_calls == [['git', 'add', '--', 'a', 'b', 'c']]
+
+    def test_flush_batches(self, git_calls, real_effects, monkeypatch):
+        """
+        Flushing stages paths in batches of at most `GIT_ARGS_BATCH_SIZE` and
+        empties the queue.
+        """
+        monkeypatch.setattr(_effects, 'GIT_ARGS_BATCH_SIZE', 2)
+        real_effects.git_stage('a', 'b', 'c', 'd', 'e')
+        real_effects.flush()
+        assert git_calls == [
+            ['git', 'add', '--', 'a', 'b'],
+            ['git', 'add', '--', 'c', 'd'],
+            ['git', 'add', '--', 'e']]
+        real_effects.flush()
+        assert len(git_calls) == 3
+
+    def test_flush_nothing(self, git_calls, real_effects):
+        """
+        Flushing without anything staged does not run git.
+        """
+        real_effects.flush()
+        assert git_calls == []
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from cacofonix._config import Config
+from cacofonix.main import CliState
+
+
+class TestCliState:
+    """
+    Tests for `CliState`.
+    """
+    def test_close_unused(self):
+        """
+        Closing without having used the application does not create it.
+        """
+        state = CliState(Config(), dry_run=False)
+        state.close()
+        assert 'app' not in state.__dict__
+
+    def test_close_flushes(self):
+        """
+        Closing after using the application flushes its side effects.
+        """
+        flushed = []
+        state = CliState(Config(), dry_run=False)
+        state.app = SimpleNamespace(
+            effects=SimpleNamespace(flush=lambda: flushed.append(True)))
+        state.close()
+        assert flushed == [True]
@@ -0,0 +1,63 @@
+import pytest
+
+from cacofonix._towncrier import render_fragment
+from cacofonix.errors import InvalidChangeMetadata
+
+
+class TestRenderFragment:
+    """
+    Tests for `render_fragment`.
+    """
+    def test_description(self):
+        """
+        The first line of the description is followed by the rest of it.
+        """
+        fragment = {'description': 'First line\n\nMore detail\n'}
+        assert render_fragment(fragment, True, 'markdown') == (
+            'First line\n\nMore detail')
+
+    def test_feature_flags_and_issues(self):
+        """
+        Feature flags and issues are rendered after the first line of the
+        description, issues are sorted.
+        """
+        fragment = {
+            'description': 'Change\nDetail',
+            'feature_flags': ['a', 'b'],
+            'issues': {'2': 'https://example.com/2',
+                       '1': 'https://example.com/1'},
+        }
+        assert render_fragment(fragment, True, 'markdown') == (
+            'Change (Features: `a`, `b`) '
+            '[#1](https://example.com/1) [#2](https://example.com/2)'
+            '\nDetail')
+
+    def test_rest(self):
+        """
+        Issues are rendered as reStructuredText links.
+        """
+        fragment = {
+            'description': 'Change',
+            'feature_flags': ['a'],
+            'issues': {'ABC-1': 'https://example.com/1'},
+        }
+        assert render_fragment(fragment, True, 'rest') == (
+            'Change (Feature: `a`) `ABC-1 <https://example.com/1>`')
+
+    def test_no_showcontent(self):
+        """
+        Only issues are rendered if content is not shown.
+        """
+        fragment = {
+            'description': 'Change',
+            'issues': {'1': 'https://example.com/1'},
+        }
+        assert render_fragment(fragment, False, 'markdown') == (
+            ' [#1](https://example.com/1)')
+
+    def test_missing_description(self):
+        """
+        A description is required.
+        """
+        with pytest.raises(InvalidChangeMetadata):
+            render_fragment({'description': ''}, True, 'markdown')